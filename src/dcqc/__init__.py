@@ -13,13 +13,39 @@ finally:
     del version, PackageNotFoundError
 
 import logging
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dcqc import tests
+    from dcqc import suites
+    from dcqc.suites import suite_abc
+
+# Submodules are imported on first access (PEP 562) to keep `import dcqc` cheap.
+# Suite modules are loaded on demand by `SuiteABC.list_subclasses()`.
+_lazy_imports: dict[str, str] = {
+    "tests": "dcqc.tests",
+    "suite_abc": "dcqc.suites.suite_abc",
+    "suites": "dcqc.suites",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _lazy_imports:
+        message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(message)
+    module = import_module(_lazy_imports[name])
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_imports))
 
-# Import suites to ensure that they are defined and thus discoverable
-# It is located here to avoid a circular import
-from dcqc import tests
-from dcqc.suites import suite_abc
-from dcqc.suites import suites
 
 # Set default logging handler to avoid "No handler found" warnings
-logging.getLogger(__name__).addHandler(logging.NullHandler())
+# This is only done once in case the package is reloaded
+_logger = logging.getLogger(__name__)
+if not any(isinstance(h, logging.NullHandler) for h in _logger.handlers):
+    _logger.addHandler(logging.NullHandler())
 logging.captureWarnings(True)
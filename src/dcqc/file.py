@@ -13,27 +13,39 @@ from __future__ import annotations
 
 import glob
 import os
-from collections.abc import Collection, Mapping
-from copy import deepcopy
+import stat
+import sys
+from collections.abc import Collection, Iterable, Mapping, Sequence
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
+from pathlib import Path, PurePath
 from tempfile import gettempdir, mkdtemp
-from typing import Any, ClassVar, Optional
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 from warnings import warn
 
-from fs.base import FS
-
 from dcqc.mixins import SerializableMixin, SerializedObject
-from dcqc.utils import is_url_local, open_parent_fs
+from dcqc.utils import is_url_local, map_concurrently, open_parent_fs
+
+# PyFilesystem is only imported once a file system is opened
+if TYPE_CHECKING:
+    from fs.base import FS
+    from fs.info import Info
 
 
 @dataclass
 class FileType:
     """Bundle information for a given file type."""
 
+    __slots__ = ("name", "file_extensions", "edam_iri", "_key")
+
     _registry: ClassVar[dict[str, FileType]]
     _registry = dict()
 
+    # Reverse index of lowercase file extensions for path-based lookups
+    _ext_index: ClassVar[dict[str, FileType]]
+    _ext_index = dict()
+
     name: str
     file_extensions: tuple[str, ...]
     edam_iri: Optional[str]
@@ -50,24 +62,95 @@ class FileType:
             name: File type name.
             file_extensions: Valid file extensions.
             edam_iri: EDAM format ontology identifier.
+
+        Raises:
+            TypeError: If the file extensions are given as a string.
         """
-        self.name = name
-        self.file_extensions = tuple(file_extensions)
+        self.name = sys.intern(name)
+        self.file_extensions = self._normalize_extensions(file_extensions)
         self.edam_iri = edam_iri
+        self._key = sys.intern(name.lower())
         self.register_file_type()
 
+    @staticmethod
+    def _normalize_extensions(file_extensions: Collection[str]) -> tuple[str, ...]:
+        """Convert file extensions into a tuple of interned strings.
+
+        Args:
+            file_extensions: Valid file extensions.
+
+        Raises:
+            TypeError: If a single string is given, which would
+                otherwise be split into individual characters.
+
+        Returns:
+            The file extensions as a tuple.
+        """
+        if isinstance(file_extensions, str):
+            message = f"File extensions ({file_extensions!r}) must not be a string."
+            raise TypeError(message)
+        return tuple(sys.intern(ext) for ext in file_extensions)
+
     def register_file_type(self) -> None:
         """Register instantiated file type for later retrieval.
 
+        Registering an identical file type again is a no-op.
+
+        Raises:
+            ValueError: If a different file type with the same
+                name has already been registered previously.
+        """
+        key = self._key
+        registered = self._registry.get(key)
+        if registered is not None:
+            if registered == self:
+                return
+            message = f"File type ({key}) is already registered ({self._registry})."
+            raise ValueError(message)
+        self._registry[key] = self
+        for file_extension in self.file_extensions:
+            self._ext_index.setdefault(file_extension.lower(), self)
+        _lookup_file_type.cache_clear()
+
+    @classmethod
+    def _bulk_register(
+        cls, specs: Iterable[tuple[str, Collection[str], Optional[str]]]
+    ) -> None:
+        """Construct and register several file types at once.
+
+        This skips the ``__init__`` dispatch for each file type and
+        merges them into the registry (and extension index) in one
+        step, which is useful for registering the built-in file types.
+
+        Args:
+            specs: Sequence of (name, file_extensions, edam_iri) tuples.
+
         Raises:
-            ValueError: If the file type's name has already
+            ValueError: If any file type name has already
                 been registered previously.
         """
-        name = self.name.lower()
-        if name in self._registry:
-            message = f"File type ({name}) is already registered ({self._registry})."
+        file_types: dict[str, FileType] = dict()
+        for name, file_extensions, edam_iri in specs:
+            file_type = cls.__new__(cls)
+            file_type.name = sys.intern(name)
+            file_type.file_extensions = cls._normalize_extensions(file_extensions)
+            file_type.edam_iri = edam_iri
+            file_type._key = sys.intern(name.lower())
+            if file_type._key in file_types:
+                message = f"File type ({file_type._key}) is specified more than once."
+                raise ValueError(message)
+            file_types[file_type._key] = file_type
+
+        duplicates = file_types.keys() & cls._registry.keys()
+        if duplicates:
+            message = f"File types ({duplicates}) are already registered."
             raise ValueError(message)
-        self._registry[name] = self
+
+        cls._registry.update(file_types)
+        for file_type in file_types.values():
+            for file_extension in file_type.file_extensions:
+                cls._ext_index.setdefault(file_extension.lower(), file_type)
+        _lookup_file_type.cache_clear()
 
     @classmethod
     def list_file_types(cls) -> list[FileType]:
@@ -92,27 +175,96 @@ class FileType:
         Returns:
             The file type object with the given name.
         """
-        file_type = file_type.lower()
-        if file_type not in cls._registry:
+        try:
+            return _lookup_file_type(file_type)
+        except KeyError:
             types = list(cls._registry)
-            message = f"File type ({file_type}) not among available options ({types})."
+            name = file_type.lower()
+            message = f"File type ({name}) not among available options ({types})."
             raise ValueError(message)
-        return cls._registry[file_type]
+
+    @classmethod
+    def from_path(cls, path: str | PurePath) -> FileType:
+        """Infer the file type from the extension of a file path.
+
+        The longest matching extension takes precedence (e.g.,
+        ``.ome.tif`` over ``.tif``). This only requires one
+        dictionary lookup per dot in the file name.
+
+        Args:
+            path: File path or URL.
+
+        Returns:
+            The matching file type object, or the generic
+            file type ("*") if no extension matches.
+        """
+        name = os.path.basename(os.fspath(path)).lower()
+        index = name.find(".")
+        while index != -1:
+            file_type = cls._ext_index.get(name[index:])
+            if file_type is not None:
+                return file_type
+            index = name.find(".", index + 1)
+        return cls.get_file_type("*")
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Retrieve the status of a path, if it exists.
+
+    Like :meth:`pathlib.Path.exists`, symbolic links are followed.
+
+    Args:
+        path: Local path.
+
+    Returns:
+        The path status or `None` if it doesn't exist.
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+@lru_cache(maxsize=128)
+def _lookup_file_type(file_type: str) -> FileType:
+    """Retrieve a registered file type by name (case-insensitive).
+
+    Results are cached until another file type is registered.
+
+    Args:
+        file_type: File type name.
+
+    Raises:
+        KeyError: If the file type name isn't registered.
+
+    Returns:
+        The file type object with the given name.
+    """
+    registry = FileType._registry
+    # Avoid lowercasing when callers already use the registry key
+    registered = registry.get(file_type)
+    if registered is None:
+        registered = registry[file_type.lower()]
+    return registered
 
 
 # TODO: These file types could be moved to an external file
-# Instantiated file types are automatically tracked by the FileType class
-FileType("*", (), "format_1915")  # To represent all file types
-FileType("TXT", (".txt",), "format_1964")
-FileType("JSON", (".json",), "format_3464")
-FileType("JSON-LD", (".jsonld",), "format_3749")
-FileType("TIFF", (".tif", ".tiff", ".svs", ".scn"), "format_3591")
-FileType("OME-TIFF", (".ome.tif", ".ome.tiff"), "format_3727")
-FileType("TSV", (".tsv"), "format_3475")
-FileType("CSV", (".csv"), "format_3752")
-FileType("BAM", (".bam"), "format_2572")
-FileType("FASTQ", (".fastq", ".fastq.gz", ".fq", ".fq.gz"), "format_1930")
-FileType("HDF5", (".hdf", ".hdf5", ".h5", ".he5", ".h5ad"), "format_3590")
+# Registered file types are automatically tracked by the FileType class
+BUILTIN_FILE_TYPES: tuple[tuple[str, Collection[str], Optional[str]], ...]
+BUILTIN_FILE_TYPES = (
+    ("*", (), "format_1915"),  # To represent all file types
+    ("TXT", (".txt",), "format_1964"),
+    ("JSON", (".json",), "format_3464"),
+    ("JSON-LD", (".jsonld",), "format_3749"),
+    ("TIFF", (".tif", ".tiff", ".svs", ".scn"), "format_3591"),
+    ("OME-TIFF", (".ome.tif", ".ome.tiff"), "format_3727"),
+    ("TSV", (".tsv",), "format_3475"),
+    ("CSV", (".csv",), "format_3752"),
+    ("BAM", (".bam",), "format_2572"),
+    ("FASTQ", (".fastq", ".fastq.gz", ".fq", ".fq.gz"), "format_1930"),
+    ("HDF5", (".hdf", ".hdf5", ".h5", ".he5", ".h5ad"), "format_3590"),
+)
+FileType._bulk_register(BUILTIN_FILE_TYPES)
 
 
 # TODO: Leverage post-init function in dataclasses
@@ -128,9 +280,27 @@ class File(SerializableMixin):
             current work directory (default).
     """
 
-    tmp_dir: ClassVar[str] = "dcqc-staged-"
+    __slots__ = (
+        "url",
+        "metadata",
+        "type",
+        "_fs",
+        "_fs_path",
+        "_name",
+        "_info",
+        "_local_path",
+        "_hash",
+        "_is_local",
+        "_resource",
+        "_serialize_paths_relative_to",
+    )
 
-    _serialized_properties = ["name", "local_path"]
+    tmp_dir: ClassVar[str] = "dcqc-staged-"
+    # Shared by all files staged without a destination in this process
+    _staging_dir: ClassVar[Optional[Path]] = None
+    _staging_dir_lock: ClassVar[Lock] = Lock()
+    # Larger buffers reduce per-read overhead when downloading large files
+    download_chunk_size: ClassVar[int] = 8 * 1024 * 1024  # 8 MiB
 
     url: str
     metadata: dict[str, Any]
@@ -143,10 +313,16 @@ class File(SerializableMixin):
         relative_to: Optional[Path] = None,
         local_path: Optional[Path] = None,
     ):
-        self.url = self._relativize_url(url, relative_to)
+        # Relativizing a URL doesn't affect whether it's local
+        self._is_local = is_url_local(url)
+        self.url, self._resource = self._parse_url(url, relative_to)
         metadata = metadata or dict()
-        self.metadata = dict(metadata)
-        self.type = self._pop_file_type()
+        # The file type is stored separately from the rest of the metadata
+        # and defaults to the generic file type ("*") if absent.
+        # Interning avoids duplicate strings across many files since
+        # they usually share the same file types and metadata keys.
+        self.metadata = {sys.intern(key): value for key, value in metadata.items()}
+        self.type = sys.intern(self.metadata.pop("file_type", "*"))
 
         self._fs: Optional[FS]
         self._fs = None
@@ -154,17 +330,37 @@ class File(SerializableMixin):
         self._fs_path = None
         self._name: Optional[str]
         self._name = None
+        self._info: Optional[Info]
+        self._info = None
         self._local_path: Optional[Path]
         self._local_path = local_path
+        self._hash: Optional[int]
+        self._hash = None
+        # Slots shadow the class-level default in `SerializableMixin`
+        self._serialize_paths_relative_to = None
 
     def __hash__(self):
-        return hash((self.url, self.type, tuple(self.metadata.items())))
+        # The URL, type, and metadata are not expected to change after init
+        if self._hash is None:
+            metadata_items = tuple(sorted(self.metadata.items()))
+            self._hash = hash((self.url, self.type, metadata_items))
+        return self._hash
 
     def __eq__(self, other):
-        return hash(self) == hash(other)
+        if not isinstance(other, File):
+            return NotImplemented
+        return (
+            self.url == other.url
+            and self.type == other.type
+            and self.metadata == other.metadata
+        )
+
+    def _parse_url(self, url: str, relative_to: Optional[Path]) -> tuple[str, str]:
+        """Split a URL once and update it if relative to another directory.
 
-    def _relativize_url(self, url: str, relative_to: Optional[Path]) -> str:
-        """Update local URLs if relative to a directory other than CWD.
+        Local URLs are updated if they are relative to a directory
+        other than the CWD. This relies on ``self._is_local``
+        having been set for the URL.
 
         Args:
             url: Local or remote location of a file.
@@ -173,34 +369,26 @@ class File(SerializableMixin):
                 current work directory (default).
 
         Returns:
-            The relativized URL.
+            The relativized URL and its resource (i.e., the
+            part of the URL after the scheme, if any).
         """
-        if self.is_url_local(url):
-            relative_to = relative_to or Path.cwd()
-            scheme, separator, resource = url.rpartition("://")
-            path = Path(resource)
-            if not path.is_absolute():
-                resource = os.path.relpath(relative_to / resource)
-            url = f"{scheme}{separator}{resource}"
-        elif not self.is_url_local(url) and relative_to is not None:
+        scheme, separator, resource = url.rpartition("://")
+        if self._is_local:
+            if not os.path.isabs(resource):
+                # Given absolute paths, `relpath()` won't look up the CWD
+                # again for both the path and the start directory
+                cwd = os.getcwd()
+                if relative_to is not None:
+                    resource = os.path.join(os.fspath(relative_to), resource)
+                resource = os.path.relpath(os.path.join(cwd, resource), cwd)
+                url = f"{scheme}{separator}{resource}"
+        elif relative_to is not None:
             message = f"URL ({url}) is remote. Ignoring relative_to ({relative_to})."
             warn(message)
-        return url
-
-    def _pop_file_type(self) -> str:
-        """Extract and remove file type from metadata.
-
-        This function defaults to the generic file type
-        ("*") if the key is absent from the metadata.
-
-        Returns:
-            The name of the file type in the metadata.
-        """
-        file_type = self.metadata.pop("file_type", "*")
-        return file_type
+        return url, resource
 
-    def _init_fs(self) -> tuple[FS, str]:
-        """Initialize file system to access URL.
+    def _ensure_fs(self) -> tuple[FS, str]:
+        """Initialize file system to access URL (if needed).
 
         All queries with this file system should use
         `self._fs_path` as the path, not `self.url`.
@@ -208,9 +396,12 @@ class File(SerializableMixin):
         Returns:
             A file system + basename pair.
         """
-        fs, fs_path = open_parent_fs(self.url)
-        self._fs_path = fs_path
-        self._fs = fs
+        fs = self._fs
+        fs_path = self._fs_path
+        if fs is None or fs_path is None:
+            fs, fs_path = open_parent_fs(self.url)
+            self._fs = fs
+            self._fs_path = fs_path
         return fs, fs_path
 
     @property
@@ -224,9 +415,11 @@ class File(SerializableMixin):
         Returns:
             The path to the local copy or `None` if unavailable.
         """
-        if self._local_path is None and self.is_url_local():
-            _local_path = self.fs.getsyspath(self.fs_path)
-            self._local_path = Path(_local_path)
+        if self._local_path is None and self._is_local:
+            # Equivalent to `getsyspath()` without opening a file system
+            expanded = os.path.expanduser(os.path.expandvars(self._resource))
+            local_path = os.path.abspath(expanded)
+            self._local_path = Path(local_path)
         if self._local_path is None:
             message = "Local path is unavailable. Use stage() to create a local copy."
             raise FileNotFoundError(message)
@@ -234,28 +427,48 @@ class File(SerializableMixin):
 
     @property
     def fs(self) -> FS:
-        """The file system that can access the URL."""
-        fs = self._fs
-        if fs is None:
-            fs, _ = self._init_fs()
+        """The file system that can access the URL.
+
+        Remote file systems are shared by all files under the same
+        root (see :func:`~dcqc.utils.open_parent_fs`), so they should
+        not be closed by individual files or their users.
+        """
+        fs, _ = self._ensure_fs()
         return fs
 
     @property
     def fs_path(self) -> str:
         """The path that can be used with the file system."""
-        fs_path = self._fs_path
-        if fs_path is None:
-            _, fs_path = self._init_fs()
+        _, fs_path = self._ensure_fs()
         return fs_path
 
     @property
     def name(self) -> str:
         """The file name according to the file system."""
         if self._name is None:
-            info = self.fs.getinfo(self.fs_path)
-            self._name = info.name
+            if self._is_local:
+                # Local file names can be derived without the file system
+                self._name = os.path.basename(self._resource.rstrip("/"))
+            elif self._info is not None:
+                self._name = self._info.name
+            else:
+                # Only the name is retained rather than the full info
+                fs, fs_path = self._ensure_fs()
+                self._name = fs.getinfo(fs_path).name
         return self._name
 
+    @property
+    def info(self) -> Info:
+        """The file information according to the file system.
+
+        The information is retrieved once and cached to avoid
+        repeated (potentially remote) lookups.
+        """
+        if self._info is None:
+            fs, fs_path = self._ensure_fs()
+            self._info = fs.getinfo(fs_path)
+        return self._info
+
     def get_file_type(self) -> FileType:
         """Retrieve the relevant file type object.
 
@@ -293,7 +506,8 @@ class File(SerializableMixin):
         Returns:
             Whether the URL refers to a local location.
         """
-        url = url or self.url
+        if not url or url == self.url:
+            return self._is_local
         return is_url_local(url)
 
     def is_file_local(self) -> bool:
@@ -311,6 +525,29 @@ class File(SerializableMixin):
         """
         return self._local_path is not None
 
+    @classmethod
+    def get_staging_dir(cls) -> Path:
+        """Retrieve the temporary directory for staging files.
+
+        A single directory is created per process (and recreated
+        if it has been deleted since) rather than one per file.
+        Hence, file names must be unique among staged files.
+        :func:`~dcqc.file.File.stage_many` checks for clashes,
+        whereas :func:`~dcqc.file.File.stage` assumes that a
+        staged file with the same name is the same file (see
+        :func:`~dcqc.file.File.already_staged`).
+
+        Returns:
+            The path of the staging directory.
+        """
+        # Files can be staged concurrently (see `stage_many()`)
+        with cls._staging_dir_lock:
+            staging_dir = cls._staging_dir
+            if staging_dir is None or not staging_dir.is_dir():
+                staging_dir = Path(mkdtemp(prefix=cls.tmp_dir))
+                cls._staging_dir = staging_dir
+        return staging_dir
+
     def already_staged(self) -> list[Path]:
         """Check if the target file has already been staged to the remote directory.
 
@@ -336,6 +573,7 @@ class File(SerializableMixin):
         self,
         destination: Optional[Path] = None,
         overwrite: bool = False,
+        chunk_size: Optional[int] = None,
     ) -> Path:
         """Create local copy of local or remote file.
 
@@ -348,6 +586,9 @@ class File(SerializableMixin):
                 Defaults to None.
             overwrite: Whether to ignore existing file at the
                 target destination. Defaults to False.
+            chunk_size: Number of bytes read at a time when
+                downloading remote files. Defaults to
+                ``File.download_chunk_size`` (8 MiB).
 
         Raises:
             ValueError: If the parent directory of the
@@ -365,23 +606,27 @@ class File(SerializableMixin):
                 # check if file has already been staged
                 staged_files = self.already_staged()
                 if not staged_files:
-                    destination_str = mkdtemp(prefix=self.tmp_dir)
-                    destination = Path(destination_str)
+                    destination = self.get_staging_dir()
                 else:
                     destination = staged_files[0]
                     self._local_path = destination
                     return destination
 
         # By this point, destination is defined (not None)
-        if destination.is_dir():
+        # Reuse stat results to avoid querying the same paths repeatedly
+        dest_stat = _stat_or_none(destination)
+        if dest_stat is not None and stat.S_ISDIR(dest_stat.st_mode):
             destination = destination / self.name
-
-        if not destination.parent.exists():
-            dest = str(destination)
-            message = f"Parent folder of destination ({dest}) does not exist."
-            raise ValueError(message)
-
-        if destination.exists() and not overwrite:
+            dest_stat = _stat_or_none(destination)
+        elif dest_stat is None:
+            # The parent folder must exist if the destination exists
+            parent_dir = os.path.dirname(destination) or os.curdir
+            if not os.path.exists(parent_dir):
+                dest = str(destination)
+                message = f"Parent folder of destination ({dest}) does not exist."
+                raise ValueError(message)
+
+        if dest_stat is not None and not overwrite:
             dest = str(destination)
             message = f"Destination ({dest}) already exists. Enable overwrite."
             raise FileExistsError(message)
@@ -390,14 +635,120 @@ class File(SerializableMixin):
         destination.unlink(missing_ok=True)
 
         if self._local_path and self.is_url_local():
-            destination.symlink_to(self._local_path.resolve())
+            os.symlink(os.path.realpath(self._local_path), destination)
         else:
             with destination.open("wb") as dest_file:
-                self.fs.download(self.fs_path, dest_file)
+                chunk_size = chunk_size or self.download_chunk_size
+                self.fs.download(self.fs_path, dest_file, chunk_size=chunk_size)
 
         self._local_path = destination
         return destination
 
+    def to_dict(self, include_name: bool = False) -> SerializedObject:
+        """Serialize the file to a dictionary.
+
+        Retrieving the name of a remote file requires a remote
+        call, so it's only done if requested or if the name is
+        already cached. Otherwise, the name is set to `None`.
+        This is also the case for files nested in other objects
+        (e.g., targets in reports), which use the default.
+
+        Args:
+            include_name: Whether to retrieve the file name
+                if it isn't cached. Defaults to False.
+
+        Returns:
+            A file serialized as a dictionary.
+        """
+        # Properties are set to `None` if unavailable (e.g., unstaged files)
+        name = None
+        if include_name or self._name is not None or self._is_local:
+            try:
+                name = self.name
+            except Exception:
+                name = None
+        try:
+            local_path = self.serialize_path(self.local_path)
+        except Exception:
+            local_path = None
+        # Built by hand since this is much faster than the generic
+        # field-by-field serialization in SerializableMixin
+        dictionary = {
+            "url": self.url,
+            "metadata": self.serialize_value(self.metadata),
+            "type": self.type,
+            "name": name,
+            "local_path": local_path,
+        }
+        return dictionary
+
+    @classmethod
+    def stage_many(
+        cls,
+        files: Sequence[File],
+        destination: Optional[Path] = None,
+        overwrite: bool = False,
+        max_workers: int = 16,
+    ) -> list[Path]:
+        """Create local copies of several files concurrently.
+
+        Staging remote files is I/O-bound, so the downloads are
+        run in a thread pool rather than one after the other.
+        Files sharing a URL are only downloaded once.
+
+        Args:
+            files: Local or remote files to stage.
+            destination: Folder where to store the files.
+                Defaults to None (see :func:`~dcqc.file.File.stage`).
+            overwrite: Whether to ignore existing files at the
+                target destination. Defaults to False.
+            max_workers: Maximum number of concurrent downloads.
+                Defaults to 16.
+
+        Raises:
+            ValueError: If files with different URLs would be
+                staged under the same name in the same folder.
+
+        Returns:
+            The paths of the local copies (in the same order).
+        """
+        # Files sharing a URL would otherwise be downloaded to the
+        # same path concurrently, so only the first one is staged
+        files_by_url: dict[str, File] = dict()
+        for file in files:
+            files_by_url.setdefault(file.url, file)
+        unique_files = list(files_by_url.values())
+
+        # Local files are left in place without a destination
+        if destination is None:
+            moved_files = [file for file in unique_files if file._local_path is None]
+        else:
+            moved_files = unique_files
+
+        def get_name(file: File) -> str:
+            return file.name
+
+        # Retrieving remote file names is also I/O-bound
+        names = map_concurrently(get_name, moved_files, max_workers)
+        urls_by_name: dict[str, str] = dict()
+        for file, name in zip(moved_files, names):
+            other_url = urls_by_name.setdefault(name, file.url)
+            if other_url != file.url:
+                message = (
+                    f"Files ({other_url}, {file.url}) can't be staged to the "
+                    f"same folder since they share the same name ({name})."
+                )
+                raise ValueError(message)
+
+        def stage(file: File) -> Path:
+            return file.stage(destination, overwrite)
+
+        paths = map_concurrently(stage, unique_files, max_workers)
+        paths_by_url = {file.url: path for file, path in zip(unique_files, paths)}
+        for file in files:
+            file._local_path = paths_by_url[file.url]
+        return [paths_by_url[file.url] for file in files]
+
     @classmethod
     def from_dict(cls, dictionary: SerializedObject) -> File:
         """Deserialize a dictionary into a file.
@@ -408,7 +759,10 @@ class File(SerializableMixin):
         Returns:
             The reconstructed file object.
         """
-        dictionary = deepcopy(dictionary)
+        # Only the top level and metadata are modified, so a shallow
+        # copy of both is enough to leave the input untouched
+        dictionary = dict(dictionary)
+        dictionary["metadata"] = dict(dictionary["metadata"])
 
         file_type = dictionary.pop("type")
         dictionary["metadata"]["file_type"] = file_type
@@ -1,6 +1,7 @@
 import json
 import sys
-from csv import DictWriter
+from csv import writer as csv_writer
+from io import StringIO
 from pathlib import Path
 from typing import List
 
@@ -35,6 +36,9 @@ skipped_tests_opt = Option(None, "--skipped-tests", "-s", help="Skipped tests")
 file_type_opt = Option(..., "--file-type", "-t", help="File type")
 metadata_opt = Option("{}", "--metadata", "-m", help="File metadata")
 
+# Columns for the `list_tests` output (in order)
+LIST_TESTS_FIELDNAMES = ("file_type", "edam_iri", "test_name", "test_tier", "test_type")
+
 
 @app.callback()
 def main(version: bool = False):
@@ -81,11 +85,11 @@ def create_tests(
     target = JsonParser.parse_object(input_json, SingleTarget)
     suite = SuiteABC.from_target(target, required_tests_maybe, skipped_tests_maybe)
 
+    # Naming the tests by type (which is unique within a suite)
+    named_tests = {f"{input_json.stem}.{test.type}.json": test for test in suite.tests}
+
     report = JsonReport()
-    for test in suite.tests:
-        output_path = output_dir / f"{input_json.stem}.{test.type}.json"
-        output_url = output_path.as_posix()
-        report.save(test, output_url, overwrite)
+    report.save_many(named_tests, output_dir.as_posix(), overwrite)
 
 
 @app.command()
@@ -135,7 +139,7 @@ def create_suite(
     required_tests_maybe = required_tests if required_tests else None
     skipped_tests_maybe = skipped_tests if skipped_tests else None
 
-    tests = [JsonParser.parse_object(test_json, BaseTest) for test_json in input_jsons]
+    tests = JsonParser.parse_many(input_jsons, BaseTest)
     suite = SuiteABC.from_tests(tests, required_tests_maybe, skipped_tests_maybe)
     report = JsonReport()
     report.save(suite, output_json, overwrite)
@@ -148,7 +152,7 @@ def combine_suites(
     overwrite: bool = overwrite_opt,
 ):
     """Combine several suite JSON files into a single JSON report"""
-    suites = [JsonParser.parse_object(json_, SuiteABC) for json_ in input_jsons]
+    suites = JsonParser.parse_many(input_jsons, SuiteABC)
     report = JsonReport()
     report.save(suites, output_json, overwrite)
 
@@ -160,21 +164,25 @@ def list_tests():
 
     rows = list()
     for file_type_name, test_classes in test_classes_by_file_type.items():
-        file_type = FileType.get_file_type(file_type_name)
-        for test_cls in test_classes:
-            test_dict = {
-                "file_type": file_type_name,
-                "edam_iri": file_type.edam_iri,
-                "test_name": test_cls.__name__,
-                "test_tier": test_cls.tier,
-                "test_type": "external" if test_cls.is_external_test else "internal",
-            }
-            rows.append(test_dict)
-
-    fieldnames = list(rows[0])
-    writer = DictWriter(sys.stdout, fieldnames)
-    writer.writeheader()
+        # Look up the file type once for all of its tests
+        edam_iri = FileType.get_file_type(file_type_name).edam_iri
+        rows.extend(
+            (
+                file_type_name,
+                edam_iri,
+                test_cls.__name__,
+                test_cls.tier,
+                "external" if test_cls.is_external_test else "internal",
+            )
+            for test_cls in test_classes
+        )
+
+    # Write the CSV output to stdout at once rather than row by row
+    buffer = StringIO()
+    writer = csv_writer(buffer)
+    writer.writerow(LIST_TESTS_FIELDNAMES)
     writer.writerows(rows)
+    sys.stdout.write(buffer.getvalue())
 
 
 @app.command()
@@ -196,15 +204,18 @@ def qc_file(
     target = SingleTarget(file)
 
     # Prepare suite (skip all external tests)
-    suite = SuiteABC.from_target(target, required_tests_maybe, skipped_tests)
-    external_tests = [test.type for test in suite.tests if test.is_external_test]
-    skipped_tests += external_tests
-    suite = SuiteABC.from_target(target, required_tests_maybe, skipped_tests)
+    # The external tests are identified from the test classes to
+    # avoid initializing the suite (and its tests) more than once
+    suite_cls = SuiteABC.get_subclass_by_file_type(target.get_file_type())
+    test_classes = suite_cls.list_test_classes()
+    external_tests = [cls.__name__ for cls in test_classes if cls.is_external_test]
+    skipped_tests = list(skipped_tests) + external_tests
+    suite = suite_cls(target, required_tests_maybe, skipped_tests)
 
     # Output QC report on stdout
     report = JsonReport()
     suite_json = report.generate(suite)
-    json.dump(suite_json, sys.stdout, indent=2)
+    sys.stdout.write(json.dumps(suite_json, indent=2))
 
 
 @app.command()
@@ -4,6 +4,7 @@ import os
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Mapping
 from dataclasses import fields
+from functools import lru_cache
 from itertools import chain
 from pathlib import Path, PurePath
 from typing import Any, ClassVar, Generic, Optional, Type, TypeVar, cast
@@ -14,8 +15,32 @@ T = TypeVar("T", bound="SerializableMixin")
 
 U = TypeVar("U", bound=Type[object])
 
+# Types that are serialized as-is (only exact matches, not subclasses)
+PASSTHROUGH_TYPES = frozenset({str, bytes, int, float, bool, type(None)})
+
+
+@lru_cache(maxsize=None)
+def _get_field_names(cls: type) -> tuple[str, ...]:
+    """Retrieve the names of the fields of a dataclass.
+
+    The names are cached per class since they don't change.
+
+    Args:
+        cls: Dataclass.
+
+    Returns:
+        The field names (in order).
+    """
+    return tuple(field.name for field in fields(cls))
+
 
 class SerializableMixin(ABC):
+    # Allow subclasses to opt into `__slots__` (i.e., no instance `__dict__`)
+    __slots__ = ()
+
+    # Overridden per instance by `serialize_paths_relative_to()`
+    _serialize_paths_relative_to: Optional[Path] = None
+
     # Used to serialize properties in addition to dataclass attributes
     _serialized_properties: ClassVar[list[str]]
     _serialized_properties = list()
@@ -31,18 +56,18 @@ class SerializableMixin(ABC):
 
     # TODO: Move this logic to JsonReport as a JSONEncoder subclass
     def serialize_paths_relative_to(self, location: Optional[Path]):
-        if location is not None and not (location.exists() and location.is_dir()):
+        # `is_dir()` is False for nonexistent paths, so one check is enough
+        if location is not None and not location.is_dir():
             message = f"Location ({location}) is not an existing directory."
             raise ValueError(message)
         self._serialize_paths_relative_to = location
 
     def serialize_path(self, path: PurePath) -> str:
         # This is useful for portability between steps in Nextflow
-        if getattr(self, "_serialize_paths_relative_to", None):
-            path_str = os.path.relpath(path, self._serialize_paths_relative_to)
-        else:
-            path_str = str(path)
-        return path_str
+        relative_to = self._serialize_paths_relative_to
+        if relative_to is None:
+            return str(path)
+        return os.path.relpath(path, relative_to)
 
     def serialize_value(self, value: Any) -> Any:
         """Ensure that all values are JSON-serializable.
@@ -54,7 +79,16 @@ class SerializableMixin(ABC):
             An equivalent JSON-serializable value.
         """
         result: Any
-        if isinstance(value, (str, bytes)):
+        # Exact type checks avoid the slower (ABC) `isinstance()` checks
+        # below for the most common types, whose subclasses fall through
+        value_type = type(value)
+        if value_type in PASSTHROUGH_TYPES:
+            result = value
+        elif value_type is dict:
+            result = {key: self.serialize_value(val) for key, val in value.items()}
+        elif value_type is list or value_type is tuple:
+            result = [self.serialize_value(item) for item in value]
+        elif isinstance(value, (str, bytes)):
             result = value
         elif isinstance(value, PurePath):
             result = self.serialize_path(value)
@@ -68,25 +102,6 @@ class SerializableMixin(ABC):
             result = value
         return result
 
-    def dict_factory(self, iterable: list[tuple[str, Any]]) -> dict[str, Any]:
-        """Generate dictionary from dataclass.
-
-        Unlike the built-in version, this function will
-        handle Path objects. This assumes that the OS
-        will not change between the serialization and
-        deserialization steps.
-
-        Args:
-            iterable: List of attribute name-value pairs.
-
-        Returns:
-            Dictionary of JSON-serializable attributes.
-        """
-        kwargs = {}
-        for key, value in iterable:
-            kwargs[key] = self.serialize_value(value)
-        return dict(**kwargs)
-
     def to_dict(self) -> SerializedObject:
         """Serialize the file to a dictionary.
 
@@ -95,8 +110,8 @@ class SerializableMixin(ABC):
         Returns:
             A file serialized as a dictionary.
         """
-        result = []
-        official_fields = [field.name for field in fields(self)]
+        result = dict()
+        official_fields = _get_field_names(type(self))
         serialized_properties = getattr(self, "_serialized_properties", [])
         for field in chain(official_fields, serialized_properties):
             # TODO: Code smell indicating that some restructuring is in order
@@ -104,9 +119,8 @@ class SerializableMixin(ABC):
                 value_raw = getattr(self, field)
             except Exception:
                 value_raw = None
-            value = self.serialize_value(value_raw)
-            result.append((field, value))
-        return self.dict_factory(result)
+            result[field] = self.serialize_value(value_raw)
+        return result
 
     # TODO: Use template method to handle `_serialized_properties`
     #       as well as `deepcopy()`
@@ -1,14 +1,15 @@
 import csv
 import json
-from collections.abc import Collection, Iterator
+from collections.abc import Collection, Iterator, Sequence
 from pathlib import Path
 from typing import Any, Optional, Type, TypeVar, cast
 
 from dcqc.file import File, FileType
 from dcqc.mixins import SerializableMixin
-from dcqc.suites.suite_abc import SuiteABC
+from dcqc.suites.suite_abc import SuiteABC, load_suite_modules
 from dcqc.target import BaseTarget, SingleTarget
 from dcqc.tests.base_test import BaseTest
+from dcqc.utils import map_concurrently
 
 # For context on TypeVar, check out this GitHub PR comment:
 # https://github.com/Sage-Bionetworks-Workflows/py-dcqc/pull/8#discussion_r1087141497
@@ -126,6 +127,32 @@ class JsonParser:
         expected = parser.check_expected_cls(object_, expected_cls)
         return expected
 
+    @classmethod
+    def parse_many(
+        cls, paths: Sequence[Path], expected_cls: Type[T], max_workers: int = 8
+    ) -> list[T]:
+        """Parse several JSON files, each containing a single object.
+
+        Reading and parsing each file is independent, so the files
+        are parsed in a thread pool rather than one after the other.
+
+        Args:
+            paths: JSON files to parse.
+            expected_cls: Expected class of the parsed objects.
+            max_workers: Maximum number of files parsed concurrently.
+                Defaults to 8.
+
+        Returns:
+            The parsed objects (in the same order).
+        """
+        # Load the suite modules upfront rather than from each worker
+        load_suite_modules()
+
+        def parse(path: Path) -> T:
+            return cls.parse_object(path, expected_cls)
+
+        return map_concurrently(parse, paths, max_workers)
+
     @classmethod
     def parse_objects(cls, path: Path, expected_cls: Type[T]) -> list[T]:
         parser = cls(path)
@@ -135,6 +162,9 @@ class JsonParser:
             message = f"JSON file ({parser.path}) does not contain a list of objects."
             raise ValueError(message)
 
-        objects = [cls.from_dict(dictionary) for dictionary in contents]
-        expected = [parser.check_expected_cls(obj, expected_cls) for obj in objects]
+        # Check each object as it's parsed instead of collecting them first
+        expected = [
+            parser.check_expected_cls(cls.from_dict(dictionary), expected_cls)
+            for dictionary in contents
+        ]
         return expected
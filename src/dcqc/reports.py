@@ -4,10 +4,10 @@ from pathlib import Path
 from typing import Any, Optional, overload
 
 from fs.base import FS
-from fs.errors import ResourceNotFound
+from fs.errors import FileExists, ResourceNotFound
 
 from dcqc.mixins import SerializableMixin, SerializedObject
-from dcqc.utils import open_parent_fs
+from dcqc.utils import map_concurrently, open_parent_fs
 
 
 # TODO: Refactor instance methods to class methods
@@ -16,15 +16,12 @@ class JsonReport:
 
     def __init__(self, paths_relative_to: Optional[Path] = None) -> None:
         self.paths_relative_to = paths_relative_to
-        self._url: Optional[str] = None
-        self._fs: Optional[FS] = None
-        self._fs_path: Optional[str] = None
 
     # TODO: Move towards an FS mixin for these functions
-    def _init_fs(self, url) -> tuple[FS, str]:
-        self._url = url
-        self._fs, self._fs_path = open_parent_fs(url)
-        return self._fs, self._fs_path
+    def _init_fs(self, url: str) -> tuple[FS, str]:
+        # Nothing is stored on the instance since reports can be saved
+        # concurrently (see `save_many()`), each with its own URL
+        return open_parent_fs(url)
 
     def _create_parent_directories(self, url: str):
         scheme, separator, resource = url.rpartition("://")
@@ -35,22 +32,31 @@ class JsonReport:
             info = fs.getinfo(fs_path)
         except ResourceNotFound:
             fs.makedirs(fs_path, recreate=True)
-            info = fs.getinfo(fs_path)
-        if not info.is_dir:
-            message = f"Parent URL ({url}) does not refer to a directory."
-            raise NotADirectoryError(message)
+        else:
+            if not info.is_dir:
+                message = f"Parent URL ({url}) does not refer to a directory."
+                raise NotADirectoryError(message)
 
-    def to_file(self, obj: Any, url: str, overwrite: bool):
+    def to_file(
+        self, obj: Any, url: str, overwrite: bool, skip_parent_check: bool = False
+    ):
+        # TODO: Implement custom serializer that handles Paths
+        #       (e.g., relativize them based on output JSON path)
+        # Encoding before opening the file avoids leaving an empty file
+        # behind if serialization fails. It also means a single write
+        # rather than one per JSON token with `json.dump()`
+        contents = json.dumps(obj, indent=2) + "\n"
         fs, fs_path = self._init_fs(url)
-        self._create_parent_directories(url)
-        if fs.exists(fs_path) and not overwrite:
+        if not skip_parent_check:
+            self._create_parent_directories(url)
+        # Exclusive creation checks for existing files while opening
+        mode = "w" if overwrite else "x"
+        try:
+            with fs.open(fs_path, mode) as outfile:
+                outfile.write(contents)
+        except FileExists:
             message = f"URL ({url}) already exists. Enable `overwrite` to ignore."
             raise FileExistsError(message)
-        # TODO: Implement custom serializer that handles Paths
-        #       (e.g., relativize them based on output JSON path)
-        with fs.open(fs_path, "w") as outfile:
-            json.dump(obj, outfile, indent=2)
-            outfile.write("\n")
 
     def _generate_single(self, item: SerializableMixin) -> SerializedObject:
         item.serialize_paths_relative_to(self.paths_relative_to)
@@ -97,11 +103,20 @@ class JsonReport:
         named_items: Mapping[str, SerializableMixin],
         parent_url: str,
         overwrite: bool = False,
+        max_workers: int = 8,
     ) -> dict[str, SerializedObject]:
-        reports = dict()
-        for name, item in named_items.items():
-            report = self.generate(item)
-            reports[name] = report
-            report_url = f"{parent_url}/{name}"
-            self.to_file(report, report_url, overwrite)
-        return reports
+        names = list(named_items)
+        if names:
+            # The reports share a parent, which only needs to be checked once
+            self._create_parent_directories(f"{parent_url}/{names[0]}")
+
+        # Each report is serialized and written independently, so
+        # the I/O-bound saves are run in a thread pool
+        def save(name: str) -> SerializedObject:
+            report = self.generate(named_items[name])
+            url = f"{parent_url}/{name}"
+            self.to_file(report, url, overwrite, skip_parent_check=True)
+            return report
+
+        reports = map_concurrently(save, names, max_workers)
+        return dict(zip(names, reports))
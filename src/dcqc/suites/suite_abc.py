@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC
 from collections.abc import Collection, Sequence
 from copy import deepcopy
 from enum import Enum
+from importlib import import_module
+from importlib.metadata import entry_points
+from threading import RLock
 from typing import ClassVar, Generic, Optional, Type, TypeVar, Union
 
 from dcqc.file import FileType
@@ -13,6 +17,43 @@ from dcqc.tests import BaseTest, TestStatus
 
 Target = TypeVar("Target", bound=BaseTarget)
 
+# Entry point group for modules that define third-party suites (plugins)
+SUITES_ENTRY_POINT_GROUP = "dcqc.suites"
+
+# Built-in suites are always available, even without package metadata
+BUILTIN_SUITE_MODULES = ("dcqc.suites.suites",)
+
+_suite_modules_loaded = False
+# Reentrant since importing a suite module might trigger a suite lookup
+_suite_modules_lock = RLock()
+
+
+def load_suite_modules() -> None:
+    """Import the modules defining suites so that they are discoverable.
+
+    Built-in suites are defined in :data:`BUILTIN_SUITE_MODULES`
+    whereas plugins are listed under the ``dcqc.suites`` entry point
+    group. This is only done once per process (unless an import fails).
+    """
+    global _suite_modules_loaded
+    if _suite_modules_loaded:
+        return
+    with _suite_modules_lock:
+        # Another thread might have loaded the modules in the meantime
+        if _suite_modules_loaded:
+            return
+        for module_name in BUILTIN_SUITE_MODULES:
+            import_module(module_name)
+        # Selecting the group upfront avoids scanning every distribution
+        if sys.version_info >= (3, 10):
+            suite_eps = entry_points(group=SUITES_ENTRY_POINT_GROUP)
+        else:  # pragma: no cover
+            suite_eps = entry_points().get(SUITES_ENTRY_POINT_GROUP, [])
+        for entry_point in suite_eps:
+            entry_point.load()
+        # Only flag the modules as loaded once all imports succeeded
+        _suite_modules_loaded = True
+
 
 class SuiteStatus(Enum):
     NONE = "NONE"  # status not yet evaluated
@@ -141,6 +182,13 @@ class SuiteABC(SerializableMixin, SubclassRegistryMixin, ABC, Generic[Target]):
 
         return suite
 
+    @classmethod
+    def list_subclasses(cls) -> tuple[Type[SuiteABC], ...]:
+        """List all subclasses, loading the suite modules if needed."""
+        # Suites are defined in separate modules to avoid a circular import
+        load_suite_modules()
+        return super().list_subclasses()
+
     @classmethod
     def list_test_classes(cls) -> tuple[Type[BaseTest], ...]:
         """List all applicable test classes"""
@@ -39,8 +39,9 @@ class BaseTarget(SerializableMixin, SubclassRegistryMixin, ABC):
         destination: Optional[Path] = None,
         overwrite: bool = False,
     ) -> list[Path]:
-        """Create local copy of local or remote file.
+        """Create local copies of local or remote files.
 
+        Remote files are downloaded concurrently.
         A destination is not required for remote files; it
         defaults to a temporary directory.
         Local files aren't moved if a destination is omitted.
@@ -58,13 +59,9 @@ class BaseTarget(SerializableMixin, SubclassRegistryMixin, ABC):
                 exists and ``overwrite`` was not enabled.
 
         Returns:
-            The path of the local copy.
+            The paths of the local copies.
         """
-        paths = list()
-        for file in self.files:
-            path = file.stage(destination, overwrite)
-            paths.append(path)
-        return paths
+        return File.stage_many(self.files, destination, overwrite)
 
     @classmethod
     def from_dict(cls, dictionary: SerializedObject) -> BaseTarget:
@@ -17,7 +17,9 @@ from dcqc.target import BaseTarget
 Target = TypeVar("Target", bound=BaseTarget)
 
 
-class TestStatus(Enum):
+# Mixing in `str` makes members directly comparable to and
+# serializable as their string values (e.g., in JSON reports)
+class TestStatus(str, Enum):
     NONE = "pending"
     FAIL = "failed"
     PASS = "passed"
@@ -4,6 +4,8 @@ from pathlib import Path
 from dcqc.target import SingleTarget
 from dcqc.tests.base_test import InternalBaseTest, TestStatus
 
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
 
 class Md5ChecksumTest(InternalBaseTest):
     tier = 1
@@ -21,8 +23,13 @@ class Md5ChecksumTest(InternalBaseTest):
 
     def _compute_md5_checksum(self, path: Path) -> str:
         hash_md5 = hashlib.md5()
+        # Reuse a single large buffer to avoid allocating every chunk
+        buffer = bytearray(CHUNK_SIZE)
+        view = memoryview(buffer)
         with path.open("rb") as infile:
-            for chunk in iter(lambda: infile.read(4096), b""):
-                hash_md5.update(chunk)
+            num_bytes = infile.readinto(buffer)
+            while num_bytes:
+                hash_md5.update(view[:num_bytes])
+                num_bytes = infile.readinto(buffer)
         actual_md5 = hash_md5.hexdigest()
         return actual_md5
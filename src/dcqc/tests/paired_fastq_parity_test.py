@@ -1,10 +1,12 @@
 import gzip
 from pathlib import Path
-from typing import TextIO
+from typing import BinaryIO, cast
 
 from dcqc.target import PairedTarget
 from dcqc.tests.base_test import InternalBaseTest, TestStatus
 
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
 
 class PairedFastqParityTest(InternalBaseTest):
     tier = 2
@@ -31,29 +33,38 @@ class PairedFastqParityTest(InternalBaseTest):
     def _count_fastq_lines(self, path: Path) -> int:
         """Count the number of lines in a FASTQ file.
 
+        The file is read in large binary chunks and newlines are
+        counted in C rather than iterating over each line.
+
         Args:
             path: Path to the FASTQ file.
 
         Returns:
             Number of lines in the given FASTQ file.
         """
-        # Source: https://stackoverflow.com/a/1019572/21077945
+        num_lines = 0
+        last_chunk = b""
         with self._open_fastq(path) as fastq:
-            num_lines = sum(1 for _ in fastq)
+            for chunk in iter(lambda: fastq.read(CHUNK_SIZE), b""):
+                num_lines += chunk.count(b"\n")
+                last_chunk = chunk
+        # Account for a final line without a trailing newline
+        if last_chunk and not last_chunk.endswith(b"\n"):
+            num_lines += 1
         return num_lines
 
-    def _open_fastq(self, path: Path) -> TextIO:
+    def _open_fastq(self, path: Path) -> BinaryIO:
         """Open a FASTQ file regardless of compression.
 
         Args:
             path: Path to the FASTQ file.
 
         Returns:
-            Opened FASTQ file (in text mode).
+            Opened FASTQ file (in binary mode).
         """
         # TODO: This logic should ideally live in the File class, and a
         #       test should confirm the integrity of compressed files
         if path.name.endswith(".gz"):
-            return gzip.open(path, "rt")
+            return cast(BinaryIO, gzip.open(path, "rb"))
         else:
-            return path.open("rt")
+            return path.open("rb")
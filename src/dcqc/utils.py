@@ -1,9 +1,27 @@
-import re
+from __future__ import annotations
 
-from fs import open_fs
-from fs.base import FS
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import TYPE_CHECKING, TypeVar
 
-LOCAL_URL_REGEX = re.compile(r"((file|osfs)://)?/?[^:]+")
+# Importing `fs` loads its opener registry, so it's deferred until needed
+if TYPE_CHECKING:
+    from fs.base import FS
+
+LOCAL_URL_PREFIXES = ("file://", "osfs://")
+
+# File systems that are opened anew for every file rather than shared.
+# Local roots can be relative to the current work directory, whereas
+# in-memory and temporary file systems are distinct for every opening.
+UNSHARED_FS_PREFIXES = LOCAL_URL_PREFIXES + ("mem://", "temp://")
+
+# Remote file systems shared by all files under the same root (by URL)
+_shared_fs_cache: dict[str, FS] = dict()
+_shared_fs_lock = Lock()
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def is_url_local(url: str) -> bool:
@@ -15,10 +33,19 @@ def is_url_local(url: str) -> bool:
     Returns:
         Whether the URL refers to a local location.
     """
-    return LOCAL_URL_REGEX.fullmatch(url) is not None
+    # Equivalent to fully matching `((file|osfs)://)?/?[^:]+`, but
+    # string methods avoid the regex engine overhead on every call
+    resource = url
+    for prefix in LOCAL_URL_PREFIXES:
+        if url.startswith(prefix):
+            resource = url[len(prefix) :]
+            break
+    return resource != "" and ":" not in resource
 
 
 def open_parent_fs(url: str) -> tuple[FS, str]:
+    from fs import open_fs
+
     # Split off prefix to avoid issues with `rpartition("/")`
     scheme, separator, resource = url.rpartition("://")
     if separator == "":
@@ -41,5 +68,57 @@ def open_parent_fs(url: str) -> tuple[FS, str]:
         fs_root = ""
 
     fs_url = prefix + fs_root
-    fs = open_fs(fs_url)
+    if prefix in UNSHARED_FS_PREFIXES:
+        fs = open_fs(fs_url)
+    else:
+        fs = _open_shared_fs(fs_url)
     return fs, path
+
+
+def _open_shared_fs(fs_url: str) -> FS:
+    """Open a remote file system, reusing it for the same URL.
+
+    Opening a remote file system can be expensive (e.g., logging
+    into Synapse), so files sharing a root reuse the same instance.
+    Hence, these file systems shouldn't be closed by their users.
+    If one is closed anyway, it's replaced on the next request.
+
+    Args:
+        fs_url: File system URL.
+
+    Returns:
+        The file system for the given URL.
+    """
+    from fs import open_fs
+
+    with _shared_fs_lock:
+        fs = _shared_fs_cache.get(fs_url)
+        if fs is None or fs.isclosed():
+            fs = open_fs(fs_url)
+            _shared_fs_cache[fs_url] = fs
+    return fs
+
+
+def map_concurrently(
+    function: Callable[[T], R], items: Sequence[T], max_workers: int
+) -> list[R]:
+    """Apply a function to each item using a thread pool.
+
+    This is useful for I/O-bound tasks (e.g., downloading files).
+    The items are processed serially if there is at most one item
+    or worker since a thread pool would only add overhead.
+
+    Args:
+        function: Function to apply to each item.
+        items: Items to process.
+        max_workers: Maximum number of concurrent threads.
+
+    Returns:
+        The results (in the same order as the items).
+    """
+    if len(items) <= 1 or max_workers <= 1:
+        return [function(item) for item in items]
+    num_workers = min(max_workers, len(items))
+    with ThreadPoolExecutor(num_workers) as executor:
+        results = list(executor.map(function, items))
+    return results
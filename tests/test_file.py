@@ -1,11 +1,14 @@
 import glob
+import json
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory, gettempdir
 from typing import List
 
 import pytest
+from fs.memoryfs import MemoryFS
 
 from dcqc.file import File, FileType
 
@@ -55,6 +58,32 @@ def test_for_an_error_if_registering_a_duplicate_file_type():
         FileType("txt", (".foo",))
 
 
+def test_that_registering_an_identical_file_type_again_is_allowed():
+    file_type = FileType.get_file_type("TXT")
+    FileType(file_type.name, file_type.file_extensions, file_type.edam_iri)
+    assert FileType.get_file_type("TXT") is file_type
+
+
+def test_for_an_error_if_file_extensions_are_given_as_a_string():
+    with pytest.raises(TypeError):
+        FileType("foo", ".foo")
+
+
+def test_that_builtin_file_types_have_whole_file_extensions():
+    for file_type in FileType.list_file_types():
+        for file_extension in file_type.file_extensions:
+            assert file_extension.startswith(".")
+            assert len(file_extension) > 1
+
+
+def test_that_a_file_type_can_be_inferred_from_a_path():
+    assert FileType.from_path("foo/bar.TXT").name == "TXT"
+    assert FileType.from_path(Path("image.ome.tif")).name == "OME-TIFF"
+    assert FileType.from_path("syn://syn123/image.v2.tif").name == "TIFF"
+    assert FileType.from_path("reads.fq.gz").name == "FASTQ"
+    assert FileType.from_path("unknown.foo").name == "*"
+
+
 def test_for_an_error_when_requesting_for_an_unregistered_file_type():
     with pytest.raises(ValueError):
         FileType.get_file_type("foo")
@@ -75,6 +104,12 @@ def test_that_a_local_file_is_not_moved_when_requesting_a_local_path(test_files)
     assert local_path.exists()
 
 
+def test_that_environment_variables_are_expanded_in_local_paths(monkeypatch):
+    monkeypatch.setenv("DCQC_TEST_DIR", "/tmp/dcqc")
+    test_file = File("$DCQC_TEST_DIR/x.txt")
+    assert test_file.local_path == Path("/tmp/dcqc/x.txt")
+
+
 def test_for_an_error_when_accessing_local_path_of_an_unstaged_remote_file(test_files):
     remote_file = test_files["remote"]
     with pytest.raises(FileNotFoundError):
@@ -107,6 +142,49 @@ def test_that_a_local_temporary_path_is_created_when_staging_a_remote_file(test_
     remove_staged_files()
 
 
+def test_that_remote_files_are_staged_in_the_same_temporary_directory(test_files):
+    remote_file_1 = test_files["remote"]
+    remote_file_2 = File("mem://other.txt", {"file_type": "txt"})
+    remote_file_2.fs.writetext(remote_file_2.fs_path, "foo")
+    staged_path_1 = remote_file_1.stage()
+    staged_path_2 = remote_file_2.stage()
+    assert staged_path_1.parent == staged_path_2.parent
+    shutil.rmtree(staged_path_1.parent)
+
+
+def test_that_several_remote_files_can_be_staged_concurrently(test_files):
+    remote_file_1 = test_files["remote"]
+    remote_file_2 = File("mem://other.txt", {"file_type": "txt"})
+    remote_file_2.fs.writetext(remote_file_2.fs_path, "foo")
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        paths = File.stage_many([remote_file_1, remote_file_2], tmp_dir_path)
+        assert paths == [tmp_dir_path / "test.txt", tmp_dir_path / "other.txt"]
+        assert paths[1].read_text() == "foo"
+
+
+def test_for_an_error_when_staging_different_files_with_the_same_name():
+    remote_file_1 = File("mem://first/dup.txt", {"file_type": "txt"})
+    remote_file_1.fs.writetext(remote_file_1.fs_path, "foo")
+    remote_file_2 = File("mem://second/dup.txt", {"file_type": "txt"})
+    remote_file_2.fs.writetext(remote_file_2.fs_path, "bar")
+    with TemporaryDirectory() as tmp_dir:
+        with pytest.raises(ValueError):
+            File.stage_many([remote_file_1, remote_file_2], Path(tmp_dir))
+        assert not os.listdir(tmp_dir)
+
+
+def test_that_files_sharing_a_url_are_staged_once(test_files):
+    remote_file_1 = test_files["remote"]
+    # The in-memory file system isn't shared, so this file can't be downloaded
+    remote_file_2 = File(remote_file_1.url)
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        paths = File.stage_many([remote_file_1, remote_file_2], tmp_dir_path)
+        assert paths == [tmp_dir_path / "test.txt"] * 2
+        assert remote_file_2.local_path == paths[0]
+
+
 def test_that_error_is_raised_when_a_file_has_been_staged_multiple_times(test_files):
     create_duplicate_files(2)
     remote_file = test_files["remote"]
@@ -142,6 +220,17 @@ def test_that_a_file_can_be_saved_and_restored_without_changing(test_files):
     assert file_1_dict == file_2_dict
 
 
+def test_that_a_file_is_serialized_compactly_into_json_primitives(test_files):
+    file = test_files["good_txt"]
+    assert not hasattr(file, "__dict__")
+    file_dict = file.to_dict()
+    primitives = (str, int, float, bool, type(None))
+    assert all(
+        isinstance(value, primitives) for value in file_dict["metadata"].values()
+    )
+    assert json.loads(json.dumps(file_dict)) == file_dict
+
+
 def test_that_an_absolute_local_url_is_unchanged_when_using_relative_to(get_data):
     test_path = get_data("test.txt")
     test_url = test_path.resolve().as_posix()
@@ -167,6 +256,21 @@ def test_that_file_name_is_cached(test_files):
     assert attempt_1 is attempt_2
 
 
+def test_that_a_remote_file_name_is_retrieved_without_caching_the_info(test_files):
+    file = test_files["remote"]
+    assert file.name == "test.txt"
+    assert file._info is None
+
+
+def test_that_a_remote_file_name_is_only_retrieved_on_request(test_files):
+    file = test_files["remote"]
+    file_dict = file.to_dict()
+    assert file_dict["name"] is None
+    assert file._name is None
+    file_dict = file.to_dict(include_name=True)
+    assert file_dict["name"] == "test.txt"
+
+
 def test_for_an_error_when_staging_a_file_where_one_already_exists(test_files):
     remote_file = test_files["remote"]
     existing_file = test_files["good_txt"]
@@ -219,3 +323,37 @@ def test_that_paths_change_when_using_serialize_paths_relative_to(get_output):
     file.serialize_paths_relative_to(relative_to)
     file_dict = file.to_dict()
     assert file_dict["local_path"] != str(path)
+
+
+def test_that_remote_files_sharing_a_root_share_the_file_system(mocker):
+    mocker.patch("dcqc.utils._shared_fs_cache", dict())
+    open_fs = mocker.patch("fs.open_fs", side_effect=lambda _: MemoryFS())
+    file_1 = File("syn://syn123/shared_1.txt")
+    file_2 = File("syn://syn123/shared_2.txt")
+    assert file_1.fs is file_2.fs
+    open_fs.assert_called_once_with("syn://syn123")
+
+
+def test_that_only_closed_shared_file_systems_are_reopened(mocker):
+    mocker.patch("dcqc.utils._shared_fs_cache", dict())
+    mocker.patch("fs.open_fs", side_effect=lambda _: MemoryFS())
+    closed_fs = File("syn://syn123/file.txt").fs
+    other_fs = File("syn://syn456/file.txt").fs
+    closed_fs.close()
+    assert File("syn://syn123/file.txt").fs is not closed_fs
+    assert File("syn://syn456/file.txt").fs is other_fs
+
+
+def test_that_in_memory_files_do_not_share_the_file_system():
+    file_1 = File("mem://unshared_1.txt")
+    file_2 = File("mem://unshared_2.txt")
+    assert file_1.fs is not file_2.fs
+
+
+def test_that_concurrent_staging_creates_a_single_staging_dir(monkeypatch):
+    monkeypatch.setattr(File, "_staging_dir", None)
+    with ThreadPoolExecutor(8) as executor:
+        futures = [executor.submit(File.get_staging_dir) for _ in range(32)]
+        staging_dirs = {future.result() for future in futures}
+    assert len(staging_dirs) == 1
+    staging_dirs.pop().rmdir()
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from dcqc import tests
@@ -15,6 +17,12 @@ def test_for_an_error_when_retrieving_a_test_that_does_not_exist_by_name():
         BaseTest.get_subclass_by_name("FooBar")
 
 
+def test_that_a_test_status_can_be_used_as_a_string():
+    assert TestStatus.PASS == "passed"
+    assert TestStatus("failed") is TestStatus.FAIL
+    assert json.dumps({"status": TestStatus.SKIP}) == '{"status": "skipped"}'
+
+
 def test_for_error_when_importing_unavailable_module(test_targets):
     target = test_targets["good_txt"]
     test = tests.FileExtensionTest(target)
@@ -129,3 +137,8 @@ class TestPairedFastqParityTest:
         self,
     ):
         assert self.good_compressed_paired_test.get_status() == TestStatus.PASS
+
+    def test_that_fastq_lines_are_counted_without_a_trailing_newline(self, tmp_path):
+        fastq_path = tmp_path / "reads.fastq"
+        fastq_path.write_bytes(b"@read1\nACGT\n+\nIIII")
+        assert self.good_paired_test._count_fastq_lines(fastq_path) == 4
@@ -1,4 +1,5 @@
 import shutil
+from pathlib import Path
 from subprocess import check_output
 from typing import Any
 
@@ -91,6 +92,22 @@ def test_compute_test(get_data, get_output):
     assert output_path.exists()
 
 
+def test_that_a_removed_output_dir_is_recreated(get_data, tmp_path, monkeypatch):
+    input_json = get_data("test.internal.json")
+    # The input JSON refers to its file relative to the repository root
+    data_dir = tmp_path / "tests" / "data"
+    data_dir.mkdir(parents=True)
+    shutil.copy(get_data("test.txt"), data_dir)
+    monkeypatch.chdir(tmp_path)
+    output_path = Path("out/test.json")
+    args = ["compute-test", input_json, output_path]
+    for _ in range(2):
+        shutil.rmtree("out", ignore_errors=True)
+        result = run_command(args)
+        check_command_result(result)
+        assert output_path.exists()
+
+
 def test_create_suite(get_data, get_output):
     input_json = get_data("test.computed.json")
     output_path = get_output("create_suite") / "suite.json"
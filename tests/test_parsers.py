@@ -1,4 +1,6 @@
+import sys
 from collections.abc import Generator
+from subprocess import run
 
 import pytest
 
@@ -64,3 +66,25 @@ def test_that_json_parser_can_parse_multiple_objects(get_data):
     result = JsonParser.parse_objects(json_path, BaseTest)
     assert len(result) > 0
     assert isinstance(result[0], BaseTest)
+
+
+def test_that_json_parser_can_parse_many_files_in_order(get_data):
+    json_paths = [get_data("test.internal.json"), get_data("test.external.json")]
+    result = JsonParser.parse_many(json_paths, BaseTest)
+    expected = [JsonParser.parse_object(path, BaseTest) for path in json_paths]
+    assert [test.type for test in result] == [test.type for test in expected]
+
+
+def test_that_json_parser_can_parse_many_suites_in_a_fresh_interpreter(get_data):
+    # Suite classes are loaded lazily, which must not race with the workers
+    json_path = get_data("suite.json").as_posix()
+    script = (
+        "from pathlib import Path\n"
+        "from dcqc.parsers import JsonParser\n"
+        "from dcqc.suites.suite_abc import SuiteABC\n"
+        f"paths = [Path({json_path!r})] * 8\n"
+        "suites = JsonParser.parse_many(paths, SuiteABC)\n"
+        "assert len(suites) == 8\n"
+    )
+    result = run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
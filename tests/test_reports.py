@@ -1,3 +1,6 @@
+import json
+import shutil
+
 import pytest
 
 from dcqc.reports import JsonReport
@@ -27,3 +30,49 @@ def test_for_an_error_when_saving_to_a_file_with_a_parent_being_a_file(test_file
     report = JsonReport()
     with pytest.raises(NotADirectoryError):
         report.save(file, report_url)
+
+
+def test_that_the_parent_directory_is_only_checked_once_when_saving_many(
+    test_files, get_output, mocker
+):
+    file = test_files["good_txt"]
+    parent_url = get_output("save_many").as_posix()
+    named_items = {"first.json": file, "second.json": file}
+    report = JsonReport()
+    spy = mocker.spy(report, "_init_fs")
+    report.save_many(named_items, parent_url, overwrite=True)
+    assert spy.call_args_list.count(mocker.call(parent_url)) == 1
+
+
+def test_that_a_removed_parent_directory_is_recreated_on_a_later_save(
+    test_files, get_output
+):
+    file = test_files["good_txt"]
+    parent_path = get_output("save_after_removal")
+    report = JsonReport()
+    for name in ["first.json", "second.json"]:
+        shutil.rmtree(parent_path, ignore_errors=True)
+        report.save(file, (parent_path / name).as_posix())
+        assert (parent_path / name).exists()
+
+
+def test_that_no_file_is_left_behind_when_a_report_cannot_be_serialized(get_output):
+    report_path = get_output("unserializable/report.json")
+    report = JsonReport()
+    with pytest.raises(TypeError):
+        report.to_file({"x": object()}, report_path.as_posix(), overwrite=False)
+    assert not report_path.exists()
+
+
+def test_that_reports_saved_concurrently_are_written_to_their_own_urls(
+    test_files, get_output
+):
+    local_files = [file for file in test_files.values() if file.is_url_local()]
+    named_items = {f"{index}.json": file for index, file in enumerate(local_files)}
+    parent_path = get_output("save_many_concurrently")
+    report = JsonReport()
+    parent_url = parent_path.as_posix()
+    reports = report.save_many(named_items, parent_url, True, max_workers=4)
+    for name, expected in reports.items():
+        saved = json.loads((parent_path / name).read_text())
+        assert saved == expected
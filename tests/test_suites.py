@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from dcqc.file import FileType
+from dcqc.suites import suite_abc
 from dcqc.suites.suite_abc import SuiteABC, SuiteStatus
 from dcqc.suites.suites import FileSuite, OmeTiffSuite, TiffSuite
 from dcqc.tests import (
@@ -139,3 +140,14 @@ def test_that_status_is_computed_if_not_already_assigned(test_targets):
         suite_status = suite.get_status()
         assert suite_status == SuiteStatus.GREEN
         patch_compute_status.assert_called_once()
+
+
+def test_that_suite_modules_are_loaded_again_after_a_failed_import():
+    with patch.object(suite_abc, "_suite_modules_loaded", False):
+        failing_modules = ("dcqc.suites.nonexistent",)
+        with patch.object(suite_abc, "BUILTIN_SUITE_MODULES", failing_modules):
+            with pytest.raises(ImportError):
+                suite_abc.load_suite_modules()
+        assert not suite_abc._suite_modules_loaded
+        suite_abc.load_suite_modules()
+        assert suite_abc._suite_modules_loaded